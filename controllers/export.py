@@ -143,16 +143,12 @@ class CatalogExport(http.Controller):
 
             writer.writerow(headers)
 
-            # Prix selon pricelist du client
-            pricelist = catalog_client.pricelist_id
+            # Prix catalogue du client, calculés en une fois
+            prices = catalog_client._get_product_prices(products)
 
             # Ajouter les produits
             for product in products:
-                # Calculer le prix
-                if pricelist:
-                    price = pricelist._get_product_price(product, 1.0)
-                else:
-                    price = product.list_price
+                price = prices[product.id]
 
                 # Image (optionnel - peut être lourd)
                 if include_images and product.image_1920:
@@ -305,8 +301,9 @@ class CatalogExport(http.Controller):
             if not products:
                 raise UserError(_('No accessible products to export.'))
 
-            # Prix selon pricelist du client
+            # Prix catalogue du client, calculés en une fois
             pricelist = catalog_client.pricelist_id
+            prices = catalog_client._get_product_prices(products)
             include_images = kwargs.get('include_images', '0') in ('1', 'true', 'True', True)
 
             # Check if supplier info should be included
@@ -357,11 +354,7 @@ class CatalogExport(http.Controller):
 
             # ---- Données ----
             for row_idx, product in enumerate(products, start=2):
-                # Prix
-                if pricelist:
-                    price = pricelist._get_product_price(product, 1.0)
-                else:
-                    price = product.list_price
+                price = prices[product.id]
 
                 row_data = [
                     f'__import__.supplier_{catalog_client.id}_product_{product.id}',
@@ -602,8 +595,14 @@ class CatalogExport(http.Controller):
             if not products:
                 return {'success': False, 'error': 'No accessible products'}
             
-            # Prix selon pricelist
-            pricelist = catalog_client.pricelist_id
+            # Prix catalogue du client, calculés en une fois. Si le calcul
+            # groupé échoue, chaque produit est recalculé seul dans la boucle
+            # pour que l'erreur ne concerne que lui
+            try:
+                prices = catalog_client._get_product_prices(products)
+            except Exception as e:
+                _logger.warning("Batch pricing failed for client %s: %s", catalog_client.id, e)
+                prices = {}
             
             # Importer les produits
             imported = 0
@@ -612,10 +611,9 @@ class CatalogExport(http.Controller):
             for product in products:
                 try:
                     # Calculer prix
-                    if pricelist:
-                        price = pricelist._get_product_price(product, 1.0)
-                    else:
-                        price = product.list_price
+                    price = prices.get(product.id)
+                    if price is None:
+                        price = catalog_client._get_product_prices(product)[product.id]
                     
                     # External ID pour éviter doublons
                     external_id = f'supplier_{catalog_client.id}_product_{product.id}'
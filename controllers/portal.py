@@ -226,11 +226,8 @@ class CatalogPortal(CustomerPortal):
             ip_address=request.httprequest.remote_addr,
         )
         
-        # Prix selon pricelist du client
-        if catalog_client.pricelist_id:
-            price = catalog_client.pricelist_id._get_product_price(product, 1.0)
-        else:
-            price = product.list_price
+        # Prix catalogue du client
+        price = catalog_client._get_product_prices(product)[product.id]
         
         # Variant data
         variants = []
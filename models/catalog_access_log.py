@@ -111,6 +111,11 @@ class CatalogAccessLog(models.Model):
         store=True
     )
     
+    # Partial index for the per-product export statistics
+    _export_create_date_idx = models.Index(
+        "(create_date DESC) WHERE action IN ('export_csv', 'export_excel', 'direct_import')"
+    )
+
     @api.model
     def log_action(self, action, client_id=None, user_id=None, product_ids=None, **kwargs):
         """
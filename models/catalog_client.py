@@ -210,16 +210,19 @@ class CatalogClient(models.Model):
         for client in self:
             client.selected_product_count = len(client.selected_product_ids)
 
-    @api.model
-    def create(self, vals):
-        """Crée le client et un utilisateur portal si nécessaire"""
-        client = super().create(vals)
+    @api.model_create_multi
+    def create(self, vals_list):
+        """Crée les clients et un utilisateur portal si nécessaire"""
+        clients = super().create(vals_list)
 
         # Créer un utilisateur portal si le partner n'en a pas
-        if not client.partner_id.user_ids:
-            client._create_portal_user()
+        # (désactivable via le contexte 'catalog_skip_portal_user')
+        if not self.env.context.get('catalog_skip_portal_user'):
+            for client in clients:
+                if not client.partner_id.user_ids:
+                    client._create_portal_user()
 
-        return client
+        return clients
     
     def _create_portal_user(self):
         """Crée un utilisateur portal pour ce client"""
@@ -290,6 +293,20 @@ class CatalogClient(models.Model):
         """
         self.ensure_one()
         return self.env['product.template'].search(self._get_accessible_domain())
+
+    def _get_product_prices(self, products):
+        """
+        Retourne les prix catalogue des produits pour ce client, calculés
+        en une fois : prix de la pricelist du client, ou prix de vente si
+        le client n'a pas de pricelist.
+
+        Returns:
+            dict: {product_id: prix}
+        """
+        self.ensure_one()
+        if self.pricelist_id:
+            return self.pricelist_id._get_products_price(products, 1.0)
+        return {product.id: product.list_price for product in products}
     
     def action_view_access_logs(self):
         """Action pour voir les logs d'accès de ce client"""
@@ -3,6 +3,9 @@
 from odoo import models, fields, api
 from odoo.exceptions import ValidationError
 from datetime import timedelta
+import re
+
+_HEX_COLOR_RE = re.compile(r'^#[0-9A-Fa-f]{6}$')
 
 
 class CatalogConfig(models.Model):
@@ -226,10 +229,9 @@ class CatalogConfig(models.Model):
     @api.constrains('portal_primary_color')
     def _check_color_format(self):
         """Validation du format de couleur hex"""
-        import re
         for config in self:
             if config.portal_primary_color:
-                if not re.match(r'^#[0-9A-Fa-f]{6}$', config.portal_primary_color):
+                if not _HEX_COLOR_RE.match(config.portal_primary_color):
                     raise ValidationError('Color must be in hex format (#RRGGBB)')
     
     def action_view_clients(self):
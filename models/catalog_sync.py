@@ -628,13 +628,38 @@ class CatalogClientConnection(models.Model):
             _logger.error("Error creating supplier partner: %s", e)
             raise UserError(_('Failed to create partner: %s') % str(e))
 
-    def _get_supplierinfo_price(self, product, pricelist=None):
+    def _get_supplierinfo_prices(self, products):
+        """
+        Get the client pricelist prices of the given products in one batch,
+        when the supplierinfo records created by the sync use them.
+
+        Args:
+            products: product.template recordset
+
+        Returns:
+            dict: {product_id: price}, or None when no pricelist price is needed
+        """
+        self.ensure_one()
+
+        if not (self.create_supplierinfo and self.supplier_partner_id
+                and self.supplierinfo_price_field == 'pricelist'):
+            return None
+        try:
+            return self.client_id._get_product_prices(products)
+        except Exception as e:
+            # Priced again per product in _get_supplierinfo_price(), where a
+            # failure only affects the supplierinfo of that product
+            _logger.warning("Batch supplierinfo pricing failed for connection %s: %s", self.id, e)
+            return None
+
+    def _get_supplierinfo_price(self, product, pricelist=None, prices=None):
         """
         Get the price to use for product.supplierinfo based on configuration.
 
         Args:
             product: product.template record
             pricelist: optional product.pricelist record
+            prices: optional dict {product_id: price} from _get_supplierinfo_prices()
 
         Returns:
             float: The price to use
@@ -644,7 +669,9 @@ class CatalogClientConnection(models.Model):
         if self.supplierinfo_price_field == 'standard_price':
             price = product.standard_price
         elif self.supplierinfo_price_field == 'pricelist' and pricelist:
-            price = pricelist._get_product_price(product, 1.0)
+            if not prices or product.id not in prices:
+                prices = pricelist._get_products_price(product, 1.0)
+            price = prices[product.id]
         else:
             price = product.list_price
 
@@ -1270,11 +1297,13 @@ class CatalogSyncPreview(models.TransientModel):
             models = connection._get_xmlrpc_proxy('object')
 
             # Process each change (excluding those marked as excluded)
-            for change in self.change_ids.filtered(lambda c: not c.is_excluded):
+            changes = self.change_ids.filtered(lambda c: not c.is_excluded)
+            prices = connection._get_supplierinfo_prices(changes.product_id)
+            for change in changes:
                 product_name = change.product_id.name or 'Unknown'
                 try:
                     if change.change_type == 'create':
-                        client_id = self._execute_create(change, models, uid, connection)
+                        client_id = self._execute_create(change, models, uid, connection, prices)
                         stats['created'] += 1
                         product_results.append({
                             'name': product_name,
@@ -1284,7 +1313,7 @@ class CatalogSyncPreview(models.TransientModel):
                         })
 
                     elif change.change_type == 'update':
-                        self._execute_update(change, models, uid, connection)
+                        self._execute_update(change, models, uid, connection, prices)
                         stats['updated'] += 1
                         product_results.append({
                             'name': product_name,
@@ -1449,6 +1478,7 @@ class CatalogSyncPreview(models.TransientModel):
 
                     changes = preview.change_ids.filtered(lambda c: not c.is_excluded)
                     total = len(changes)
+                    prices = connection._get_supplierinfo_prices(changes.product_id)
 
                     for idx, change in enumerate(changes, 1):
                         try:
@@ -1478,7 +1508,9 @@ class CatalogSyncPreview(models.TransientModel):
                             cr.commit()
 
                             if change.change_type == 'create':
-                                client_id = preview._execute_create(change, models_proxy, client_uid, connection)
+                                client_id = preview._execute_create(
+                                    change, models_proxy, client_uid, connection, prices
+                                )
                                 stats['created'] += 1
                                 product_results.append({
                                     'name': product_name,
@@ -1487,7 +1519,9 @@ class CatalogSyncPreview(models.TransientModel):
                                     'client_id': client_id,
                                 })
                             elif change.change_type == 'update':
-                                preview._execute_update(change, models_proxy, client_uid, connection)
+                                preview._execute_update(
+                                    change, models_proxy, client_uid, connection, prices
+                                )
                                 stats['updated'] += 1
                                 product_results.append({
                                     'name': product_name,
@@ -1588,7 +1622,7 @@ class CatalogSyncPreview(models.TransientModel):
         except Exception as e:
             _logger.error("Background sync thread crashed: %s", e, exc_info=True)
 
-    def _execute_create(self, change, models_proxy, uid, connection):
+    def _execute_create(self, change, models_proxy, uid, connection, prices=None):
         """Create a new product in client Odoo"""
         product = change.product_id
         external_id = f'supplier_{connection.client_id.id}_product_{product.id}'
@@ -1639,7 +1673,7 @@ class CatalogSyncPreview(models.TransientModel):
             # Create product.supplierinfo for invoice recognition
             if connection.create_supplierinfo and connection.supplier_partner_id:
                 self._create_or_update_supplierinfo(
-                    product, client_product_id, models_proxy, uid, connection
+                    product, client_product_id, models_proxy, uid, connection, prices
                 )
 
             # Sync variants if enabled
@@ -1664,7 +1698,7 @@ class CatalogSyncPreview(models.TransientModel):
             _logger.error("Error creating product %s: %s", product.name, e, exc_info=True)
             raise
 
-    def _execute_update(self, change, models_proxy, uid, connection):
+    def _execute_update(self, change, models_proxy, uid, connection, prices=None):
         """Update existing product in client Odoo"""
         product = change.product_id
         client_product_id = change.client_product_id
@@ -1723,7 +1757,7 @@ class CatalogSyncPreview(models.TransientModel):
         # Update product.supplierinfo for invoice recognition
         if connection.create_supplierinfo and connection.supplier_partner_id:
             self._create_or_update_supplierinfo(
-                product, client_product_id, models_proxy, uid, connection
+                product, client_product_id, models_proxy, uid, connection, prices
             )
 
         # Sync variants if enabled
@@ -1742,7 +1776,8 @@ class CatalogSyncPreview(models.TransientModel):
                 models_proxy, uid, selected_variant_ids
             )
 
-    def _create_or_update_supplierinfo(self, product, client_product_id, models_proxy, uid, connection):
+    def _create_or_update_supplierinfo(self, product, client_product_id, models_proxy, uid, connection,
+                                       prices=None):
         """
         Create or update product.supplierinfo record in client's Odoo.
         This enables automatic product recognition when loading supplier invoices.
@@ -1753,13 +1788,14 @@ class CatalogSyncPreview(models.TransientModel):
             models_proxy: XML-RPC models proxy
             uid: XML-RPC user ID
             connection: catalog.client.connection record
+            prices: optional dict {product_id: price} from connection._get_supplierinfo_prices()
         """
         try:
             # Get pricelist for price calculation if needed
             pricelist = connection.client_id.pricelist_id if connection.client_id else None
 
             # Calculate price
-            price = connection._get_supplierinfo_price(product, pricelist)
+            price = connection._get_supplierinfo_price(product, pricelist, prices)
 
             # Supplier product code = our default_code (the reference on our invoices)
             supplier_product_code = product.default_code or ''
@@ -3,6 +3,30 @@
 from odoo import models, fields, api
 
 
+# Product image URL parts, joined around the product id
+_IMAGE_URL_PREFIX = '/web/image/product.template/'
+_IMAGE_URL_SUFFIX = '/image_1920'
+
+# Value getters for each exportable catalog field, keyed by technical name.
+# Only the getters of enabled fields are evaluated in get_catalog_data().
+_CATALOG_FIELD_GETTERS = {
+    'name': lambda p, price: p.name,
+    'default_code': lambda p, price: p.default_code or '',
+    'barcode': lambda p, price: p.barcode or '',
+    'list_price': lambda p, price: price,
+    'standard_price': lambda p, price: p.standard_price,
+    'uom_name': lambda p, price: p.uom_id.name,
+    'categ_name': lambda p, price: p.categ_id.display_name,
+    'description_sale': lambda p, price: p.description_sale or '',
+    'catalog_description': lambda p, price: p.catalog_description or p.description_sale or '',
+    'weight': lambda p, price: p.weight,
+    'volume': lambda p, price: p.volume,
+    'image_url': lambda p, price: _IMAGE_URL_PREFIX + str(p.id) + _IMAGE_URL_SUFFIX,
+    'is_featured': lambda p, price: p.catalog_featured,
+    'type': lambda p, price: p.type,
+}
+
+
 class ProductTemplate(models.Model):
     """
     Extension du modèle product.template pour ajouter
@@ -64,6 +88,14 @@ class ProductTemplate(models.Model):
 
         Log = self.env['catalog.access.log']
 
+        # Fast path: no log at all (fresh database), skip the aggregations
+        if not Log.search_count([], limit=1):
+            for product in self:
+                product.export_count = 0
+                product.last_export_date = False
+                product.view_count = 0
+            return
+
         # Export counts: single query via read_group on the m2m relation
         export_data = Log.read_group(
             domain=[
@@ -141,7 +173,7 @@ class ProductTemplate(models.Model):
             'domain': [('product_ids', 'in', self.id)],
         }
     
-    def get_catalog_data(self, pricelist=None, export_fields=None):
+    def get_catalog_data(self, pricelist=None, export_fields=None, price_cache=None):
         """
         Retourne les données du produit formatées pour l'export catalogue.
 
@@ -149,6 +181,9 @@ class ProductTemplate(models.Model):
             pricelist: Product.Pricelist pour calculer le prix (optionnel)
             export_fields: catalog.export.field recordset (optionnel)
                           Si non fourni, utilise la config globale
+            price_cache: dict {product_id: prix} calculé en une fois par
+                         l'appelant, ex. catalog.client._get_product_prices()
+                         (optionnel, prioritaire sur pricelist)
 
         Returns:
             dict: Données du produit (seulement les champs activés)
@@ -160,35 +195,22 @@ class ProductTemplate(models.Model):
             config = self.env['catalog.config'].get_config()
             export_fields = config.get_enabled_export_fields()
 
-        # Build field mapping with all possible values
-        if pricelist:
-            price = pricelist._get_product_price(self, 1.0)
-        else:
-            price = self.list_price
-
-        all_field_values = {
-            'id': self.id,
-            'name': self.name,
-            'default_code': self.default_code or '',
-            'barcode': self.barcode or '',
-            'list_price': price,
-            'standard_price': self.standard_price,
-            'uom_name': self.uom_id.name,
-            'categ_name': self.categ_id.display_name,
-            'description_sale': self.description_sale or '',
-            'catalog_description': self.catalog_description or self.description_sale or '',
-            'weight': self.weight,
-            'volume': self.volume,
-            'image_url': f'/web/image/product.template/{self.id}/image_1920',
-            'is_featured': self.catalog_featured,
-            'type': self.type,
-        }
+        enabled_names = {ef.technical_name for ef in export_fields}
+
+        # Only resolve the pricelist price when the price is exported
+        price = None
+        if 'list_price' in enabled_names:
+            if price_cache and self.id in price_cache:
+                price = price_cache[self.id]
+            elif pricelist:
+                price = pricelist._get_product_price(self, 1.0)
+            else:
+                price = self.list_price
 
-        # Filter to only enabled fields (always include id)
-        enabled_names = set(export_fields.mapped('technical_name'))
+        # Evaluate only the enabled fields (always include id)
         result = {'id': self.id}
-        for field_name, value in all_field_values.items():
+        for field_name, getter in _CATALOG_FIELD_GETTERS.items():
             if field_name in enabled_names:
-                result[field_name] = value
+                result[field_name] = getter(self, price)
 
         return result
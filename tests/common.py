@@ -0,0 +1,183 @@
+# -*- coding: utf-8 -*-
+
+from odoo.tests import TransactionCase
+
+
+# Context for fixture creation. The tests do not check mail side effects or
+# the portal user created with each catalog client, so both are skipped
+# unless a test asks for them.
+CATALOG_TEST_CONTEXT = {
+    'tracking_disable': True,
+    'mail_create_nolog': True,
+    'mail_create_nosubscribe': True,
+    'mail_notrack': True,
+    'no_reset_password': True,
+    'catalog_skip_portal_user': True,
+}
+
+
+def get_export_fields(env, field_specs):
+    """
+    Return the export fields for the given (technical_name, name) pairs, in
+    that order, creating the missing ones in a single batch
+    """
+    ExportField = env['catalog.export.field']
+    existing = {
+        field.technical_name: field
+        for field in ExportField.search([
+            ('technical_name', 'in', [tech_name for tech_name, _name in field_specs]),
+        ])
+    }
+    created = iter(ExportField.create([
+        {'name': name, 'technical_name': tech_name}
+        for tech_name, name in field_specs
+        if tech_name not in existing
+    ]))
+    return ExportField.concat(*(
+        existing.get(tech_name) or next(created)
+        for tech_name, _name in field_specs
+    ))
+
+
+class CatalogCommon(TransactionCase):
+    """
+    Base class with the catalog fixtures shared by most test classes:
+    a partner (without catalog client), a product category and
+    published/unpublished products in that category.
+
+    Fixtures are created once per class; each test runs in its own
+    savepoint (TransactionCase), so tests may freely modify or unlink
+    them without rebuilding the fixtures.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env = cls.env(context=dict(cls.env.context, **CATALOG_TEST_CONTEXT))
+
+        cls.partner = cls.env['res.partner'].create({
+            'name': 'Catalog Test Partner',
+            'email': 'testclient@example.com',
+        })
+        cls.category = cls.env['product.category'].create({
+            'name': 'Test Category',
+        })
+        cls.product1, cls.product2, cls.product_unpublished = cls.env['product.template'].create([{
+            'name': 'Test Product 1',
+            'is_published': True,
+            'categ_id': cls.category.id,
+            'list_price': 100.0,
+        }, {
+            'name': 'Test Product 2',
+            'is_published': True,
+            'categ_id': cls.category.id,
+            'list_price': 200.0,
+        }, {
+            'name': 'Unpublished Product',
+            'is_published': False,
+            'categ_id': cls.category.id,
+        }])
+
+
+class CatalogFixturesCase(CatalogCommon):
+    """
+    CatalogCommon plus a catalog client for the shared partner, a client
+    connection and product attributes with values.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.client = cls.env['catalog.client'].create({
+            'name': 'Catalog Test Client',
+            'partner_id': cls.partner.id,
+        })
+        cls.connection = cls.env['catalog.client.connection'].create({
+            'client_id': cls.client.id,
+            'odoo_url': 'https://test.odoo.com',
+            'database': 'test_db',
+            'api_key': 'test_key',
+        })
+
+        cls.attribute_color, cls.attribute_size, cls.attribute_material = \
+            cls.env['product.attribute'].create([
+                {'name': 'Color'},
+                {'name': 'Size'},
+                {'name': 'Material'},
+            ])
+        (cls.value_red, cls.value_blue, cls.value_small,
+         cls.value_cotton, cls.value_silk) = cls.env['product.attribute.value'].create([
+            {'name': 'Red', 'attribute_id': cls.attribute_color.id},
+            {'name': 'Blue', 'attribute_id': cls.attribute_color.id},
+            {'name': 'Small', 'attribute_id': cls.attribute_size.id},
+            {'name': 'Cotton', 'attribute_id': cls.attribute_material.id},
+            {'name': 'Silk', 'attribute_id': cls.attribute_material.id},
+        ])
+
+
+class CatalogSyncCommon(TransactionCase):
+    """
+    Base class for the catalog synchronization tests: a catalog client,
+    products to sync and a default connection for that client.
+    """
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env = cls.env(context=dict(cls.env.context, **CATALOG_TEST_CONTEXT))
+        cls.Connection = cls.env['catalog.client.connection']
+        cls.FieldMapping = cls.env['catalog.field.mapping']
+        cls.CategoryMapping = cls.env['catalog.category.mapping']
+        cls.Preview = cls.env['catalog.sync.preview']
+        cls.Change = cls.env['catalog.sync.change']
+        cls.History = cls.env['catalog.sync.history']
+
+        # Create a test partner
+        cls.partner = cls.env['res.partner'].create({
+            'name': 'Test Client',
+            'email': 'client@test.com',
+        })
+
+        # Create a test catalog client
+        cls.catalog_client = cls.env['catalog.client'].create({
+            'name': 'Test Client',
+            'partner_id': cls.partner.id,
+            'is_active': True,
+        })
+
+        # Create test products
+        cls.category1 = cls.env['product.category'].create({
+            'name': 'Electronics',
+        })
+
+        cls.product1, cls.product2 = cls.env['product.template'].create([{
+            'name': 'Test Product 1',
+            'default_code': 'TEST001',
+            'list_price': 100.0,
+            'categ_id': cls.category1.id,
+            'type': 'consu',
+        }, {
+            'name': 'Test Product 2',
+            'default_code': 'TEST002',
+            'list_price': 200.0,
+            'categ_id': cls.category1.id,
+            'type': 'consu',
+        }])
+
+        # Connection shared by the tests that need no specific settings
+        cls.connection = cls.Connection.create({
+            'client_id': cls.catalog_client.id,
+            'odoo_url': 'https://test.odoo.com',
+            'database': 'test_db',
+            'api_key': 'test_key',
+        })
+
+    def _make_connection(self, **values):
+        """Helper: create a connection for the test client with the given values"""
+        return self.Connection.create({
+            'client_id': self.catalog_client.id,
+            'odoo_url': 'https://test.odoo.com',
+            'database': 'test_db',
+            'api_key': 'test_key',
+            **values,
+        })
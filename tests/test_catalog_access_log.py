@@ -1,28 +1,19 @@
 # -*- coding: utf-8 -*-
 
-from odoo.tests import TransactionCase, tagged
+from odoo.tests import tagged
 from datetime import datetime, timedelta
 
+from .common import CatalogFixturesCase
+
 
 @tagged('post_install', '-at_install', 'catalog')
-class TestCatalogAccessLog(TransactionCase):
+class TestCatalogAccessLog(CatalogFixturesCase):
     """Tests for catalog.access.log model"""
 
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
-        cls.partner = cls.env['res.partner'].create({
-            'name': 'Log Test Partner',
-            'email': 'logtest@example.com',
-        })
-        cls.client = cls.env['catalog.client'].create({
-            'name': 'Log Test Client',
-            'partner_id': cls.partner.id,
-        })
-        cls.product = cls.env['product.template'].create({
-            'name': 'Log Test Product',
-            'is_published': True,
-        })
+        cls.product = cls.product1
         cls.user = cls.env.user
 
     def test_log_creation_basic(self):
@@ -105,15 +96,14 @@ class TestCatalogAccessLog(TransactionCase):
     def test_get_statistics_basic(self):
         """Test get_statistics without filters"""
         # Create some logs
-        self.env['catalog.access.log'].create({
+        self.env['catalog.access.log'].create([{
             'action': 'view_catalog',
             'client_id': self.client.id,
-        })
-        self.env['catalog.access.log'].create({
+        }, {
             'action': 'export_csv',
             'client_id': self.client.id,
             'product_count': 5,
-        })
+        }])
 
         stats = self.env['catalog.access.log'].get_statistics()
 
@@ -170,18 +160,11 @@ class TestCatalogAccessLog(TransactionCase):
     def test_get_statistics_success_rate(self):
         """Test success rate calculation"""
         # Create successful and failed logs
-        self.env['catalog.access.log'].create({
-            'action': 'export_csv',
-            'success': True,
-        })
-        self.env['catalog.access.log'].create({
-            'action': 'export_csv',
-            'success': True,
-        })
-        self.env['catalog.access.log'].create({
-            'action': 'export_csv',
-            'success': False,
-        })
+        self.env['catalog.access.log'].create([
+            {'action': 'export_csv', 'success': True},
+            {'action': 'export_csv', 'success': True},
+            {'action': 'export_csv', 'success': False},
+        ])
 
         stats = self.env['catalog.access.log'].get_statistics()
 
@@ -216,35 +199,27 @@ class TestCatalogAccessLog(TransactionCase):
             'api_request',
         ]
 
-        for action_type in action_types:
-            log = self.env['catalog.access.log'].create({
-                'action': action_type,
-            })
+        logs = self.env['catalog.access.log'].create([
+            {'action': action_type} for action_type in action_types
+        ])
+        for log, action_type in zip(logs, action_types):
             self.assertEqual(log.action, action_type)
 
     def test_export_format_types(self):
         """Test all export format types"""
         formats = ['csv', 'excel', 'json']
 
-        for fmt in formats:
-            log = self.env['catalog.access.log'].create({
-                'action': 'export_csv',
-                'export_format': fmt,
-            })
+        logs = self.env['catalog.access.log'].create([
+            {'action': 'export_csv', 'export_format': fmt} for fmt in formats
+        ])
+        for log, fmt in zip(logs, formats):
             self.assertEqual(log.export_format, fmt)
 
     def test_multiple_products(self):
         """Test log with multiple products"""
-        product2 = self.env['product.template'].create({
-            'name': 'Product 2',
-        })
-        product3 = self.env['product.template'].create({
-            'name': 'Product 3',
-        })
-
         log = self.env['catalog.access.log'].log_action(
             action='export_csv',
-            product_ids=[self.product.id, product2.id, product3.id],
+            product_ids=[self.product.id, self.product2.id, self.product_unpublished.id],
         )
 
         self.assertEqual(log.product_count, 3)
@@ -252,21 +227,12 @@ class TestCatalogAccessLog(TransactionCase):
 
     def test_client_deletion_sets_null(self):
         """Test that deleting client sets client_id to null"""
-        partner = self.env['res.partner'].create({
-            'name': 'Deletable Partner',
-            'email': 'delete@example.com',
-        })
-        client = self.env['catalog.client'].create({
-            'name': 'Deletable Client',
-            'partner_id': partner.id,
-        })
-
         log = self.env['catalog.access.log'].create({
             'action': 'view_catalog',
-            'client_id': client.id,
+            'client_id': self.client.id,
         })
 
-        client.unlink()
+        self.client.unlink()
 
         # Log should still exist but client_id should be None
         self.assertTrue(log.exists())
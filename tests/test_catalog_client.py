@@ -2,51 +2,38 @@
 
 from odoo.tests import TransactionCase, tagged
 from odoo.exceptions import ValidationError, UserError
+from odoo.fields import Command
+from odoo.tools import mute_logger
+
+from .common import CATALOG_TEST_CONTEXT, CatalogCommon
 
 
 @tagged('post_install', '-at_install', 'catalog')
-class TestCatalogClient(TransactionCase):
+class TestCatalogClient(CatalogCommon):
     """Tests for catalog.client model"""
 
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
-        # Create test partner
-        cls.partner = cls.env['res.partner'].create({
-            'name': 'Test Client Partner',
-            'email': 'testclient@example.com',
+        # Persisted client shared by tests that only read it
+        cls.client = cls.env['catalog.client'].create({
+            'name': 'Test Client',
+            'partner_id': cls.partner.id,
         })
-
-        # Create test product category
-        cls.category = cls.env['product.category'].create({
-            'name': 'Test Category',
+        cls.variant1 = cls.product1.product_variant_ids[:1]
+        # Copied by tests needing a partner of their own
+        cls.partner_template = cls.env['res.partner'].create({
+            'name': 'Template Partner',
+            'email': 'template@example.com',
         })
 
-        # Create test products
-        cls.product1 = cls.env['product.template'].create({
-            'name': 'Test Product 1',
-            'is_published': True,
-            'categ_id': cls.category.id,
-            'list_price': 100.0,
-        })
-        cls.product2 = cls.env['product.template'].create({
-            'name': 'Test Product 2',
-            'is_published': True,
-            'categ_id': cls.category.id,
-            'list_price': 200.0,
-        })
-        cls.product_unpublished = cls.env['product.template'].create({
-            'name': 'Unpublished Product',
-            'is_published': False,
-            'categ_id': cls.category.id,
-        })
+    def _make_partner(self, name, email):
+        """Return a new partner copied from the template partner"""
+        return self.partner_template.copy({'name': name, 'email': email})
 
     def test_client_creation(self):
         """Test basic client creation"""
-        client = self.env['catalog.client'].create({
-            'name': 'Test Client',
-            'partner_id': self.partner.id,
-        })
+        client = self.client
 
         self.assertTrue(client)
         self.assertEqual(client.name, 'Test Client')
@@ -56,50 +43,15 @@ class TestCatalogClient(TransactionCase):
 
     def test_unique_partner_constraint(self):
         """Test that one partner can only have one client"""
-        self.env['catalog.client'].create({
-            'name': 'First Client',
-            'partner_id': self.partner.id,
-        })
-
-        # Create another partner for second client
-        partner2 = self.env['res.partner'].create({
-            'name': 'Another Partner',
-            'email': 'another@example.com',
-        })
-
-        with self.assertRaises(ValidationError):
+        # self.client already exists for self.partner
+        with self.assertRaises(ValidationError), self.env.cr.savepoint(), mute_logger('odoo.models'):
             self.env['catalog.client'].create({
                 'name': 'Second Client',
                 'partner_id': self.partner.id,  # Same partner
             })
 
-    def test_accessible_products_full_mode(self):
-        """Test full access mode returns all published products"""
-        partner = self.env['res.partner'].create({
-            'name': 'Full Access Partner',
-            'email': 'full@example.com',
-        })
-        client = self.env['catalog.client'].create({
-            'name': 'Full Access Client',
-            'partner_id': partner.id,
-            'access_mode': 'full',
-        })
-
-        products = client._get_accessible_products()
-
-        # Should include published products
-        self.assertIn(self.product1, products)
-        self.assertIn(self.product2, products)
-        # Should not include unpublished
-        self.assertNotIn(self.product_unpublished, products)
-
-    def test_accessible_products_restricted_mode(self):
-        """Test restricted mode returns only products in allowed categories"""
-        partner = self.env['res.partner'].create({
-            'name': 'Restricted Partner',
-            'email': 'restricted@example.com',
-        })
-
+    def test_accessible_products_all_modes(self):
+        """Test _get_accessible_products for each access mode"""
         # Create another category with a product
         other_category = self.env['product.category'].create({
             'name': 'Other Category',
@@ -110,46 +62,33 @@ class TestCatalogClient(TransactionCase):
             'categ_id': other_category.id,
         })
 
-        client = self.env['catalog.client'].create({
-            'name': 'Restricted Client',
-            'partner_id': partner.id,
-            'access_mode': 'restricted',
-            'allowed_category_ids': [(6, 0, [self.category.id])],
-        })
-
-        products = client._get_accessible_products()
-
-        # Should include products from allowed category
-        self.assertIn(self.product1, products)
-        self.assertIn(self.product2, products)
-        # Should not include products from other categories
-        self.assertNotIn(other_product, products)
-
-    def test_accessible_products_custom_mode(self):
-        """Test custom mode returns only specified products"""
-        partner = self.env['res.partner'].create({
-            'name': 'Custom Partner',
-            'email': 'custom@example.com',
-        })
-        client = self.env['catalog.client'].create({
-            'name': 'Custom Client',
-            'partner_id': partner.id,
-            'access_mode': 'custom',
-            'allowed_product_ids': [(6, 0, [self.product1.id])],
-        })
-
-        products = client._get_accessible_products()
-
-        # Should only include product1
-        self.assertIn(self.product1, products)
-        self.assertNotIn(self.product2, products)
+        client = self.client
+        client.write({
+            'allowed_category_ids': [Command.set([self.category.id])],
+            'allowed_product_ids': [Command.set([self.product1.id])],
+        })
+
+        # (mode, expected products, excluded products)
+        cases = [
+            # All published products, never unpublished ones
+            ('full', self.product1 | self.product2 | other_product, self.product_unpublished),
+            # Only products from allowed categories
+            ('restricted', self.product1 | self.product2, other_product | self.product_unpublished),
+            # Only the specified products
+            ('custom', self.product1, self.product2 | self.product_unpublished),
+        ]
+        for mode, included, excluded in cases:
+            with self.subTest(mode=mode):
+                client.access_mode = mode
+                products = client._get_accessible_products()
+                for product in included:
+                    self.assertIn(product, products)
+                for product in excluded:
+                    self.assertNotIn(product, products)
 
     def test_email_related_field(self):
         """Test that email is related to partner"""
-        client = self.env['catalog.client'].create({
-            'name': 'Test Client',
-            'partner_id': self.partner.id,
-        })
+        client = self.client
 
         self.assertEqual(client.email, 'testclient@example.com')
 
@@ -157,41 +96,6 @@ class TestCatalogClient(TransactionCase):
         self.partner.email = 'newemail@example.com'
         self.assertEqual(client.email, 'newemail@example.com')
 
-    def test_access_url_computation(self):
-        """Test that access_url is computed correctly"""
-        client = self.env['catalog.client'].create({
-            'name': 'Test Client',
-            'partner_id': self.partner.id,
-        })
-
-        self.assertEqual(client.access_url, '/catalog/portal')
-
-    def test_action_view_access_logs(self):
-        """Test action_view_access_logs returns correct action"""
-        client = self.env['catalog.client'].create({
-            'name': 'Test Client',
-            'partner_id': self.partner.id,
-        })
-
-        action = client.action_view_access_logs()
-
-        self.assertEqual(action['type'], 'ir.actions.act_window')
-        self.assertEqual(action['res_model'], 'catalog.access.log')
-        self.assertIn(('client_id', '=', client.id), action['domain'])
-
-    def test_action_open_portal(self):
-        """Test action_open_portal returns correct action"""
-        client = self.env['catalog.client'].create({
-            'name': 'Test Client',
-            'partner_id': self.partner.id,
-        })
-
-        action = client.action_open_portal()
-
-        self.assertEqual(action['type'], 'ir.actions.act_url')
-        self.assertEqual(action['url'], '/catalog/portal')
-        self.assertEqual(action['target'], 'new')
-
     def test_create_portal_user_requires_email(self):
         """Test that creating portal user requires email"""
         partner_no_email = self.env['res.partner'].create({
@@ -201,56 +105,39 @@ class TestCatalogClient(TransactionCase):
         # so creating a client for a partner without email raises UserError
         with self.assertRaises(UserError):
             self.env['catalog.client'].with_context(
-                no_reset_password=True
+                catalog_skip_portal_user=False,
             ).create({
                 'name': 'No Email Client',
                 'partner_id': partner_no_email.id,
             })
 
-    def test_export_statistics(self):
-        """Test export statistics computation"""
-        client = self.env['catalog.client'].create({
-            'name': 'Test Client',
-            'partner_id': self.partner.id,
-        })
+    def test_statistics(self):
+        """Test export and access statistics computation"""
+        client = self.client
 
         # Initially zero
+        client.read(['export_count', 'last_export_date', 'total_access_count', 'last_access_date'])
         self.assertEqual(client.export_count, 0)
         self.assertFalse(client.last_export_date)
+        self.assertEqual(client.total_access_count, 0)
+        self.assertFalse(client.last_access_date)
 
-        # Create export log
-        self.env['catalog.access.log'].create({
+        # Create export and access logs
+        self.env['catalog.access.log'].create([{
             'client_id': client.id,
             'action': 'export_csv',
             'product_count': 5,
-        })
-
-        # Refresh computed fields
-        client.invalidate_recordset()
-
-        self.assertEqual(client.export_count, 1)
-        self.assertTrue(client.last_export_date)
-
-    def test_access_statistics(self):
-        """Test access statistics computation"""
-        client = self.env['catalog.client'].create({
-            'name': 'Test Client',
-            'partner_id': self.partner.id,
-        })
-
-        # Initially zero
-        self.assertEqual(client.total_access_count, 0)
-        self.assertFalse(client.last_access_date)
-
-        # Create access log
-        self.env['catalog.access.log'].create({
+        }, {
             'client_id': client.id,
             'action': 'view_catalog',
-        })
+        }])
 
-        # Refresh computed fields
+        # Refresh computed fields, fetched together
         client.invalidate_recordset()
+        client.read(['export_count', 'last_export_date', 'total_access_count', 'last_access_date'])
 
+        self.assertEqual(client.export_count, 1)
+        self.assertTrue(client.last_export_date)
         self.assertEqual(client.total_access_count, 1)
         self.assertTrue(client.last_access_date)
 
@@ -260,20 +147,41 @@ class TestCatalogClient(TransactionCase):
             'name': 'Test Pricelist',
         })
 
-        client = self.env['catalog.client'].create({
-            'name': 'Test Client',
-            'partner_id': self.partner.id,
+        self.client.pricelist_id = pricelist
+
+        self.assertEqual(self.client.pricelist_id, pricelist)
+
+    def test_get_product_prices(self):
+        """Test product prices follow the client pricelist, or the sales price"""
+        products = self.product1 | self.product2
+
+        # No pricelist: sales prices
+        self.assertEqual(
+            self.client._get_product_prices(products),
+            {self.product1.id: 100.0, self.product2.id: 200.0},
+        )
+
+        # Pricelist with a fixed price for product1 only
+        pricelist = self.env['product.pricelist'].create({
+            'name': 'Client Prices',
+        })
+        self.env['product.pricelist.item'].create({
             'pricelist_id': pricelist.id,
+            'compute_price': 'fixed',
+            'fixed_price': 80.0,
+            'applied_on': '1_product',
+            'product_tmpl_id': self.product1.id,
         })
+        self.client.pricelist_id = pricelist
 
-        self.assertEqual(client.pricelist_id, pricelist)
+        self.assertEqual(
+            self.client._get_product_prices(products),
+            {self.product1.id: 80.0, self.product2.id: 200.0},
+        )
 
     def test_selected_product_count_computation(self):
         """Test selected_product_count is computed correctly"""
-        partner = self.env['res.partner'].create({
-            'name': 'Cart Partner',
-            'email': 'cart@example.com',
-        })
+        partner = self._make_partner('Cart Partner', 'cart@example.com')
         client = self.env['catalog.client'].create({
             'name': 'Cart Client',
             'partner_id': partner.id,
@@ -283,98 +191,97 @@ class TestCatalogClient(TransactionCase):
         self.assertEqual(client.selected_product_count, 0)
 
         # Add products to cart
-        client.selected_product_ids = [(6, 0, [self.product1.id, self.product2.id])]
+        client.selected_product_ids = [Command.set([self.product1.id, self.product2.id])]
         self.assertEqual(client.selected_product_count, 2)
 
         # Remove one
-        client.selected_product_ids = [(3, self.product1.id)]
+        client.selected_product_ids = [Command.unlink(self.product1.id)]
         self.assertEqual(client.selected_product_count, 1)
+        self.assertEqual(client.selected_product_ids, self.product2)
 
     def test_selected_variant_ids(self):
         """Test variant selection field works"""
-        partner = self.env['res.partner'].create({
-            'name': 'Variant Partner',
-            'email': 'variant@example.com',
-        })
+        partner = self._make_partner('Variant Partner', 'variant@example.com')
         client = self.env['catalog.client'].create({
             'name': 'Variant Client',
             'partner_id': partner.id,
         })
 
-        # Get product variants
-        variant = self.product1.product_variant_ids[0]
-
-        client.selected_variant_ids = [(6, 0, [variant.id])]
+        client.selected_variant_ids = [Command.set(self.variant1.ids)]
         self.assertEqual(len(client.selected_variant_ids), 1)
-        self.assertEqual(client.selected_variant_ids[0], variant)
-
-    def test_get_accessible_domain_full(self):
-        """Test _get_accessible_domain for full access mode"""
-        partner = self.env['res.partner'].create({
-            'name': 'Domain Full Partner',
-            'email': 'domain_full@example.com',
-        })
-        client = self.env['catalog.client'].create({
-            'name': 'Domain Full Client',
-            'partner_id': partner.id,
-            'access_mode': 'full',
-        })
-
-        domain = client._get_accessible_domain()
+        self.assertEqual(client.selected_variant_ids, self.variant1)
+
+    def test_get_accessible_domain_all_modes(self):
+        """Test _get_accessible_domain for each access mode"""
+        client = self.client
+        client.write({
+            'allowed_category_ids': [Command.set([self.category.id])],
+            'allowed_product_ids': [Command.set([self.product1.id])],
+        })
+
+        cases = [
+            ('full', [
+                ('is_published', '=', True),
+            ]),
+            ('restricted', [
+                ('is_published', '=', True),
+                ('categ_id', 'child_of', [self.category.id]),
+            ]),
+            ('custom', [
+                ('id', 'in', [self.product1.id]),
+                ('is_published', '=', True),
+            ]),
+        ]
+        for mode, expected in cases:
+            with self.subTest(mode=mode):
+                client.access_mode = mode
+                self.assertEqual(client._get_accessible_domain(), expected)
 
-        self.assertEqual(domain, [('is_published', '=', True)])
-
-    def test_get_accessible_domain_restricted(self):
-        """Test _get_accessible_domain for restricted mode"""
-        partner = self.env['res.partner'].create({
-            'name': 'Domain Restricted Partner',
-            'email': 'domain_restricted@example.com',
-        })
-        client = self.env['catalog.client'].create({
-            'name': 'Domain Restricted Client',
-            'partner_id': partner.id,
+    def test_accessible_domain_matches_products(self):
+        """Test that _get_accessible_domain and _get_accessible_products give consistent results"""
+        client = self.client
+        client.write({
             'access_mode': 'restricted',
-            'allowed_category_ids': [(6, 0, [self.category.id])],
+            'allowed_category_ids': [Command.set([self.category.id])],
         })
 
-        domain = client._get_accessible_domain()
+        expected_ids = set(self.env['product.template'].search(client._get_accessible_domain()).ids)
+        self.assertEqual(set(client._get_accessible_products().ids), expected_ids)
 
-        self.assertIn(('is_published', '=', True), domain)
-        self.assertIn(('categ_id', 'child_of', [self.category.id]), domain)
 
-    def test_get_accessible_domain_custom(self):
-        """Test _get_accessible_domain for custom mode"""
-        partner = self.env['res.partner'].create({
-            'name': 'Domain Custom Partner',
-            'email': 'domain_custom@example.com',
+@tagged('at_install', 'catalog')
+class TestCatalogClientPure(TransactionCase):
+    """Tests for catalog.client methods that need no post-install state"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.env = cls.env(context=dict(cls.env.context, **CATALOG_TEST_CONTEXT))
+        cls.partner = cls.env['res.partner'].create({
+            'name': 'Pure Test Partner',
+            'email': 'pure@example.com',
         })
-        client = self.env['catalog.client'].create({
-            'name': 'Domain Custom Client',
-            'partner_id': partner.id,
-            'access_mode': 'custom',
-            'allowed_product_ids': [(6, 0, [self.product1.id])],
+        cls.client = cls.env['catalog.client'].create({
+            'name': 'Test Client',
+            'partner_id': cls.partner.id,
         })
 
-        domain = client._get_accessible_domain()
+    def test_access_url_computation(self):
+        """Test that access_url is computed correctly"""
+        self.assertEqual(self.client.access_url, '/catalog/portal')
 
-        self.assertIn(('is_published', '=', True), domain)
-        self.assertIn(('id', 'in', [self.product1.id]), domain)
+    def test_action_view_access_logs(self):
+        """Test action_view_access_logs returns correct action"""
+        action = self.client.action_view_access_logs()
 
-    def test_accessible_domain_matches_products(self):
-        """Test that _get_accessible_domain and _get_accessible_products give consistent results"""
-        partner = self.env['res.partner'].create({
-            'name': 'Consistency Partner',
-            'email': 'consistency@example.com',
-        })
-        client = self.env['catalog.client'].create({
-            'name': 'Consistency Client',
-            'partner_id': partner.id,
-            'access_mode': 'restricted',
-            'allowed_category_ids': [(6, 0, [self.category.id])],
-        })
+        self.assertEqual(action['type'], 'ir.actions.act_window')
+        self.assertEqual(action['res_model'], 'catalog.access.log')
+        self.assertIn(('client_id', '=', self.client.id), action['domain'])
 
-        domain = client._get_accessible_domain()
-        products_from_domain = self.env['product.template'].search(domain)
-        products_from_method = client._get_accessible_products()
+    def test_action_open_portal(self):
+        """Test action_open_portal returns correct action"""
+        action = self.client.action_open_portal()
 
-        self.assertEqual(set(products_from_domain.ids), set(products_from_method.ids))
+        self.assertEqual(action['type'], 'ir.actions.act_url')
+        self.assertEqual(action['url'], '/catalog/portal')
+        self.assertEqual(action['target'], 'new')
@@ -3,6 +3,8 @@
 from odoo.tests import TransactionCase, tagged
 from odoo.exceptions import ValidationError
 
+from .common import CATALOG_TEST_CONTEXT
+
 
 @tagged('post_install', '-at_install', 'catalog')
 class TestCatalogConfig(TransactionCase):
@@ -11,65 +13,70 @@ class TestCatalogConfig(TransactionCase):
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
-        # Clean any existing config for clean tests
-        cls.env['catalog.config'].search([]).unlink()
+        cls.env = cls.env(context=dict(cls.env.context, **CATALOG_TEST_CONTEXT))
+        cls.Config = cls.env['catalog.config']
+        cls.ExportField = cls.env['catalog.export.field']
+        cls.Partner = cls.env['res.partner']
+        cls.Client = cls.env['catalog.client']
+        cls.AccessLog = cls.env['catalog.access.log']
+
+        # Singleton shared by all tests (browse() needs no query)
+        cls.config_id = cls.Config.get_config().id
+
+        # Clients for the statistics tests
+        partner1, partner2 = cls.Partner.create([{
+            'name': 'Stats Client 1',
+            'email': 'stats1@example.com',
+        }, {
+            'name': 'Stats Client 2',
+            'email': 'stats2@example.com',
+        }])
+        cls.client1, cls.client2 = cls.Client.create([{
+            'name': 'Stats Client 1',
+            'partner_id': partner1.id,
+        }, {
+            'name': 'Stats Client 2',
+            'partner_id': partner2.id,
+        }])
 
     def test_get_config_creates_singleton(self):
         """Test that get_config creates a config if none exists"""
-        Config = self.env['catalog.config']
-
-        # Ensure no config exists
-        self.assertFalse(Config.search([]))
+        # Ensure no config exists (rolled back with the test)
+        self.Config.search([]).unlink()
+        self.assertEqual(self.Config.search_count([]), 0)
 
         # Call get_config
-        config = Config.get_config()
+        config = self.Config.get_config()
 
         # Should create one
         self.assertTrue(config)
         self.assertEqual(config.name, 'Catalog Configuration')
 
         # Calling again should return same record
-        config2 = Config.get_config()
+        config2 = self.Config.get_config()
         self.assertEqual(config.id, config2.id)
 
-    def test_default_values(self):
-        """Test that default values are correctly set"""
-        config = self.env['catalog.config'].get_config()
-
-        self.assertTrue(config.portal_access_enabled)
-        self.assertTrue(config.allow_csv_export)
-        self.assertTrue(config.allow_excel_export)
-        self.assertTrue(config.allow_direct_odoo_import)
-        self.assertEqual(config.max_products_per_export, 1000)
-        self.assertEqual(config.export_rate_limit, 10)
-        self.assertEqual(config.default_product_visibility, 'all')
-        self.assertEqual(config.portal_primary_color, '#007bff')
-
     def test_color_validation_valid(self):
         """Test that valid hex colors are accepted"""
-        config = self.env['catalog.config'].get_config()
+        config = self.Config.browse(self.config_id)
 
-        # Valid colors
-        config.portal_primary_color = '#FF0000'
-        config.portal_primary_color = '#00ff00'
-        config.portal_primary_color = '#123456'
+        # Valid colors: one upper-case and one lower-case representative
+        for color in ('#FF0000', '#00ff00'):
+            config.write({'portal_primary_color': color})
+            self.assertEqual(config.portal_primary_color, color)
 
     def test_color_validation_invalid(self):
         """Test that invalid colors are rejected"""
-        config = self.env['catalog.config'].get_config()
+        config = self.Config.browse(self.config_id)
 
-        with self.assertRaises(ValidationError):
-            config.portal_primary_color = 'red'
-
-        with self.assertRaises(ValidationError):
-            config.portal_primary_color = '#FFF'  # Too short
-
-        with self.assertRaises(ValidationError):
-            config.portal_primary_color = '#GGGGGG'  # Invalid chars
+        for value in ('red', '#FFF', '#GGGGGG', '#FFFF', '#FFFFFFF'):
+            # The savepoint rolls back each rejected write on its own
+            with self.subTest(value=value), self.assertRaises(ValidationError), self.env.cr.savepoint():
+                config.portal_primary_color = value
 
     def test_max_products_validation(self):
         """Test that negative max_products_per_export is rejected"""
-        config = self.env['catalog.config'].get_config()
+        config = self.Config.browse(self.config_id)
 
         with self.assertRaises(ValidationError):
             config.max_products_per_export = -1
@@ -79,43 +86,40 @@ class TestCatalogConfig(TransactionCase):
 
     def test_export_fields_default(self):
         """Test that default export fields are set on new config"""
-        Config = self.env['catalog.config']
-        ExportField = self.env['catalog.export.field']
+        # Start from a new config (rolled back with the test)
+        self.Config.search([]).unlink()
 
         # Create some default export fields if they don't exist
-        if not ExportField.search([('is_default', '=', True)]):
-            ExportField.create({
+        defaults = self.ExportField.search([('is_default', '=', True)])
+        if not defaults:
+            defaults = self.ExportField.create({
                 'name': 'Test Field',
                 'technical_name': 'test_field',
                 'is_default': True,
             })
 
-        config = Config.get_config()
+        config = self.Config.get_config()
 
         # Should have default fields
-        default_fields = ExportField.search([('is_default', '=', True)])
-        if default_fields:
-            self.assertTrue(config.export_field_ids)
+        self.assertEqual(config.export_field_ids, defaults)
 
     def test_get_enabled_export_fields(self):
         """Test get_enabled_export_fields method"""
-        config = self.env['catalog.config'].get_config()
-        ExportField = self.env['catalog.export.field']
+        config = self.Config.browse(self.config_id)
 
         # Create test fields
-        field1 = ExportField.create({
+        field1, field2 = self.ExportField.create([{
             'name': 'Field 1',
             'technical_name': 'field_1',
             'sequence': 1,
-        })
-        field2 = ExportField.create({
+        }, {
             'name': 'Field 2',
             'technical_name': 'field_2',
             'sequence': 2,
-        })
+        }])
 
         # Set fields on config
-        config.export_field_ids = [(6, 0, [field1.id, field2.id])]
+        config.export_field_ids = field1 | field2
 
         # Get enabled fields
         enabled = config.get_enabled_export_fields()
@@ -125,46 +129,9 @@ class TestCatalogConfig(TransactionCase):
         self.assertEqual(enabled[0].id, field1.id)
         self.assertEqual(enabled[1].id, field2.id)
 
-    def test_statistics_computation(self):
-        """Test that statistics are computed correctly"""
-        config = self.env['catalog.config'].get_config()
-
-        # Statistics should be non-negative integers
-        self.assertGreaterEqual(config.total_clients, 0)
-        self.assertGreaterEqual(config.active_clients, 0)
-        self.assertGreaterEqual(config.total_exports_today, 0)
-        self.assertGreaterEqual(config.total_exports_month, 0)
-
-    def test_action_view_clients(self):
-        """Test action_view_clients returns correct action"""
-        config = self.env['catalog.config'].get_config()
-
-        action = config.action_view_clients()
-
-        self.assertEqual(action['type'], 'ir.actions.act_window')
-        self.assertEqual(action['res_model'], 'catalog.client')
-        self.assertIn('list', action['view_mode'])
-
-    def test_action_view_logs(self):
-        """Test action_view_logs returns correct action"""
-        config = self.env['catalog.config'].get_config()
-
-        action = config.action_view_logs()
-
-        self.assertEqual(action['type'], 'ir.actions.act_window')
-        self.assertEqual(action['res_model'], 'catalog.access.log')
-        self.assertIn('list', action['view_mode'])
-
-    def test_supplier_info_defaults(self):
-        """Test supplier info fields have correct defaults"""
-        config = self.env['catalog.config'].get_config()
-
-        self.assertTrue(config.include_supplier_info_in_exports)
-        self.assertEqual(config.supplier_external_id, 'catalog_supplier')
-
     def test_supplier_info_toggle(self):
         """Test toggling supplier info in exports"""
-        config = self.env['catalog.config'].get_config()
+        config = self.Config.browse(self.config_id)
 
         config.include_supplier_info_in_exports = False
         self.assertFalse(config.include_supplier_info_in_exports)
@@ -174,14 +141,14 @@ class TestCatalogConfig(TransactionCase):
 
     def test_supplier_external_id_custom(self):
         """Test setting a custom supplier external ID"""
-        config = self.env['catalog.config'].get_config()
+        config = self.Config.browse(self.config_id)
 
         config.supplier_external_id = 'my_company_supplier'
         self.assertEqual(config.supplier_external_id, 'my_company_supplier')
 
     def test_branding_fields(self):
         """Test branding fields can be set"""
-        config = self.env['catalog.config'].get_config()
+        config = self.Config.browse(self.config_id)
 
         config.portal_welcome_message = '<p>Welcome!</p>'
         config.support_email = 'support@test.com'
@@ -192,65 +159,105 @@ class TestCatalogConfig(TransactionCase):
 
     def test_statistics_with_data(self):
         """Test statistics computation with actual data"""
-        config = self.env['catalog.config'].get_config()
-
-        # Record baseline before creating new data
-        baseline_clients = config.total_clients
-
-        # Create clients
-        partner1 = self.env['res.partner'].create({
-            'name': 'Stats Client 1',
-            'email': 'stats1@example.com',
-        })
-        client1 = self.env['catalog.client'].create({
-            'name': 'Stats Client 1',
-            'partner_id': partner1.id,
-        })
-
-        partner2 = self.env['res.partner'].create({
-            'name': 'Stats Client 2',
-            'email': 'stats2@example.com',
-        })
-        client2 = self.env['catalog.client'].create({
-            'name': 'Stats Client 2',
-            'partner_id': partner2.id,
-        })
-
-        # Create access logs
-        self.env['catalog.access.log'].create({
-            'client_id': client1.id,
+        config = self.Config.browse(self.config_id)
+        stats_fields = [
+            'total_clients', 'active_clients', 'total_exports_today', 'total_exports_month',
+        ]
+        before = config.read(stats_fields)[0]
+
+        # Create access logs and remove one client
+        self.AccessLog.create([{
+            'client_id': self.client1.id,
             'action': 'view_catalog',
-        })
-        self.env['catalog.access.log'].create({
-            'client_id': client1.id,
+        }, {
+            'client_id': self.client1.id,
             'action': 'export_csv',
             'product_count': 5,
-        })
-
-        config.invalidate_recordset()
+        }])
+        self.client2.unlink()
 
-        self.assertEqual(config.total_clients, baseline_clients + 2)
-        self.assertGreaterEqual(config.active_clients, 1)
-        self.assertGreaterEqual(config.total_exports_today, 1)
-        self.assertGreaterEqual(config.total_exports_month, 1)
+        config.invalidate_recordset(fnames=stats_fields)
+        after = config.read(stats_fields)[0]
 
-    def test_allow_direct_odoo_import_default(self):
-        """Test allow_direct_odoo_import defaults to True"""
-        config = self.env['catalog.config'].get_config()
-        self.assertTrue(config.allow_direct_odoo_import)
+        self.assertEqual(after['total_clients'], before['total_clients'] - 1)
+        self.assertEqual(after['active_clients'], before['active_clients'] + 1)
+        self.assertEqual(after['total_exports_today'], before['total_exports_today'] + 1)
+        self.assertEqual(after['total_exports_month'], before['total_exports_month'] + 1)
 
     def test_features_can_be_individually_disabled(self):
         """Test each export feature can be disabled independently"""
-        config = self.env['catalog.config'].get_config()
+        config = self.Config.browse(self.config_id)
 
         # Disable CSV only
-        config.allow_csv_export = False
+        config.write({'allow_csv_export': False})
         self.assertFalse(config.allow_csv_export)
         self.assertTrue(config.allow_excel_export)
         self.assertTrue(config.allow_direct_odoo_import)
 
         # Disable Direct import only
-        config.allow_csv_export = True
-        config.allow_direct_odoo_import = False
+        config.write({'allow_csv_export': True, 'allow_direct_odoo_import': False})
         self.assertTrue(config.allow_csv_export)
         self.assertFalse(config.allow_direct_odoo_import)
+
+
+@tagged('post_install', '-at_install', 'catalog')
+class TestCatalogConfigReadOnly(TransactionCase):
+    """Tests for catalog.config that only read the configuration"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.Config = cls.env['catalog.config']
+        cls.config_id = cls.Config.get_config().id
+
+    def setUp(self):
+        super().setUp()
+        # Nothing below writes: make any accidental write fail loudly.
+        # The setting is reverted with the test savepoint.
+        self.env.cr.execute('SET TRANSACTION READ ONLY')
+
+    def test_default_values(self):
+        """Test the field defaults declared on the model"""
+        expected = {
+            'portal_access_enabled': True,
+            'allow_csv_export': True,
+            'allow_excel_export': True,
+            'allow_direct_odoo_import': True,
+            'max_products_per_export': 1000,
+            'export_rate_limit': 10,
+            'default_product_visibility': 'all',
+            'portal_primary_color': '#007bff',
+        }
+        self.assertEqual(self.Config.default_get(list(expected)), expected)
+
+    def test_statistics_computation(self):
+        """Test that statistics are computed correctly"""
+        config = self.Config.browse(self.config_id)
+
+        # Statistics should be non-negative integers
+        self.assertGreaterEqual(config.total_clients, 0)
+        self.assertGreaterEqual(config.active_clients, 0)
+        self.assertGreaterEqual(config.total_exports_today, 0)
+        self.assertGreaterEqual(config.total_exports_month, 0)
+
+    def test_action_views(self):
+        """Test action_view_clients and action_view_logs return correct actions"""
+        config = self.Config.browse(self.config_id)
+
+        for method, model in [
+            ('action_view_clients', 'catalog.client'),
+            ('action_view_logs', 'catalog.access.log'),
+        ]:
+            with self.subTest(method=method):
+                action = getattr(config, method)()
+
+                self.assertEqual(action['type'], 'ir.actions.act_window')
+                self.assertEqual(action['res_model'], model)
+                self.assertEqual(action['view_mode'], 'list,form')
+
+    def test_supplier_info_defaults(self):
+        """Test supplier info fields have correct defaults"""
+        config = self.Config.browse(self.config_id)
+
+        self.assertTrue(config.include_supplier_info_in_exports)
+        self.assertEqual(config.supplier_external_id, 'catalog_supplier')
@@ -1,15 +1,23 @@
 # -*- coding: utf-8 -*-
 
 from odoo.tests import TransactionCase, tagged
+from odoo.tools import mute_logger
 
+from .common import CATALOG_TEST_CONTEXT, get_export_fields
 
-@tagged('post_install', '-at_install', 'catalog')
+
+@tagged('at_install', 'catalog')
 class TestCatalogExportField(TransactionCase):
     """Tests for catalog.export.field model"""
 
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.ExportField = cls.env['catalog.export.field']
+
     def test_export_field_creation(self):
         """Test basic export field creation"""
-        field = self.env['catalog.export.field'].create({
+        field = self.ExportField.create({
             'name': 'Test Field',
             'technical_name': 'test_field_unique',
             'field_type': 'product',
@@ -22,23 +30,22 @@ class TestCatalogExportField(TransactionCase):
 
     def test_export_field_unique_technical_name(self):
         """Test that technical_name must be unique"""
-        self.env['catalog.export.field'].create({
+        self.ExportField.create({
             'name': 'Field 1',
             'technical_name': 'unique_tech_name',
         })
 
         from psycopg2 import IntegrityError
-        with self.assertRaises(IntegrityError):
-            with self.env.cr.savepoint():
-                self.env['catalog.export.field'].create({
-                    'name': 'Field 2',
-                    'technical_name': 'unique_tech_name',  # Duplicate
-                })
+        with self.assertRaises(IntegrityError), self.env.cr.savepoint(), mute_logger('odoo.sql_db'):
+            self.ExportField.create({
+                'name': 'Field 2',
+                'technical_name': 'unique_tech_name',  # Duplicate
+            })
 
     def test_get_export_header(self):
         """Test get_export_header returns correct header"""
         # With explicit header
-        field1 = self.env['catalog.export.field'].create({
+        field1 = self.ExportField.create({
             'name': 'Product Name',
             'technical_name': 'name_header_test',
             'export_header': 'product_name',
@@ -46,7 +53,7 @@ class TestCatalogExportField(TransactionCase):
         self.assertEqual(field1.get_export_header(), 'product_name')
 
         # Without explicit header (fallback to name)
-        field2 = self.env['catalog.export.field'].create({
+        field2 = self.ExportField.create({
             'name': 'Barcode',
             'technical_name': 'barcode_header_test',
         })
@@ -57,7 +64,7 @@ class TestCatalogExportField(TransactionCase):
         types = ['product', 'computed', 'relation']
 
         for field_type in types:
-            field = self.env['catalog.export.field'].create({
+            field = self.ExportField.create({
                 'name': f'Field {field_type}',
                 'technical_name': f'field_{field_type}_test',
                 'field_type': field_type,
@@ -66,7 +73,7 @@ class TestCatalogExportField(TransactionCase):
 
     def test_default_is_default(self):
         """Test is_default field default value"""
-        field = self.env['catalog.export.field'].create({
+        field = self.ExportField.create({
             'name': 'Test',
             'technical_name': 'default_test_field',
         })
@@ -74,23 +81,21 @@ class TestCatalogExportField(TransactionCase):
 
     def test_sequence_ordering(self):
         """Test fields are ordered by sequence"""
-        field1 = self.env['catalog.export.field'].create({
+        field1, field2, field3 = self.ExportField.create([{
             'name': 'Field 1',
             'technical_name': 'seq_field_1',
             'sequence': 20,
-        })
-        field2 = self.env['catalog.export.field'].create({
+        }, {
             'name': 'Field 2',
             'technical_name': 'seq_field_2',
             'sequence': 10,
-        })
-        field3 = self.env['catalog.export.field'].create({
+        }, {
             'name': 'Field 3',
             'technical_name': 'seq_field_3',
             'sequence': 15,
-        })
+        }])
 
-        fields = self.env['catalog.export.field'].search([
+        fields = self.ExportField.search([
             ('technical_name', 'in', ['seq_field_1', 'seq_field_2', 'seq_field_3'])
         ])
 
@@ -107,6 +112,7 @@ class TestExportIntegration(TransactionCase):
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
+        cls.env = cls.env(context=dict(cls.env.context, **CATALOG_TEST_CONTEXT))
         cls.config = cls.env['catalog.config'].get_config()
 
         cls.category = cls.env['product.category'].create({
@@ -137,24 +143,11 @@ class TestExportIntegration(TransactionCase):
 
     def test_export_with_configured_fields(self):
         """Test that export respects configured fields"""
-        ExportField = self.env['catalog.export.field']
-
         # Enable only name and price
-        name_field = ExportField.search([('technical_name', '=', 'name')], limit=1)
-        price_field = ExportField.search([('technical_name', '=', 'list_price')], limit=1)
-
-        if not name_field:
-            name_field = ExportField.create({
-                'name': 'Name',
-                'technical_name': 'name',
-            })
-        if not price_field:
-            price_field = ExportField.create({
-                'name': 'Price',
-                'technical_name': 'list_price',
-            })
-
-        self.config.export_field_ids = [(6, 0, [name_field.id, price_field.id])]
+        self.config.export_field_ids = get_export_fields(self.env, [
+            ('name', 'Name'),
+            ('list_price', 'Price'),
+        ])
 
         data = self.product.get_catalog_data()
 
@@ -168,8 +161,6 @@ class TestExportIntegration(TransactionCase):
 
     def test_export_all_standard_fields(self):
         """Test export with all standard fields enabled"""
-        ExportField = self.env['catalog.export.field']
-
         # Get or create all standard fields
         standard_fields = [
             ('name', 'Name'),
@@ -182,17 +173,7 @@ class TestExportIntegration(TransactionCase):
             ('volume', 'Volume'),
         ]
 
-        field_ids = []
-        for tech_name, name in standard_fields:
-            field = ExportField.search([('technical_name', '=', tech_name)], limit=1)
-            if not field:
-                field = ExportField.create({
-                    'name': name,
-                    'technical_name': tech_name,
-                })
-            field_ids.append(field.id)
-
-        self.config.export_field_ids = [(6, 0, field_ids)]
+        self.config.export_field_ids = get_export_fields(self.env, standard_fields)
 
         data = self.product.get_catalog_data()
 
@@ -221,14 +202,7 @@ class TestExportIntegration(TransactionCase):
         self.client.pricelist_id = pricelist
 
         # Enable price field
-        ExportField = self.env['catalog.export.field']
-        price_field = ExportField.search([('technical_name', '=', 'list_price')], limit=1)
-        if not price_field:
-            price_field = ExportField.create({
-                'name': 'Price',
-                'technical_name': 'list_price',
-            })
-        self.config.export_field_ids = [(6, 0, [price_field.id])]
+        self.config.export_field_ids = get_export_fields(self.env, [('list_price', 'Price')])
 
         data = self.product.get_catalog_data(pricelist=pricelist)
 
@@ -2,6 +2,8 @@
 
 from odoo.tests import TransactionCase, tagged
 
+from .common import CATALOG_TEST_CONTEXT, get_export_fields
+
 
 @tagged('post_install', '-at_install', 'catalog')
 class TestProductTemplate(TransactionCase):
@@ -10,17 +12,19 @@ class TestProductTemplate(TransactionCase):
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
+        cls.env = cls.env(context=dict(cls.env.context, **CATALOG_TEST_CONTEXT))
+
         cls.category = cls.env['product.category'].create({
             'name': 'Test Category',
         })
-        cls.uom = cls.env.ref('uom.product_uom_unit')
+        uom_unit_id = cls.env['ir.model.data']._xmlid_to_res_id('uom.product_uom_unit')
         cls.product = cls.env['product.template'].create({
             'name': 'Test Product',
             'default_code': 'TEST001',
             'barcode': '1234567890123',
             'list_price': 150.0,
             'categ_id': cls.category.id,
-            'uom_id': cls.uom.id,
+            'uom_id': uom_unit_id,
             'weight': 1.5,
             'volume': 0.5,
             'description_sale': 'Test description',
@@ -31,12 +35,32 @@ class TestProductTemplate(TransactionCase):
         # Ensure config exists
         cls.config = cls.env['catalog.config'].get_config()
 
+        # Export fields used by the tests, resolved once for the class
+        cls.export_fields = {
+            field.technical_name: field
+            for field in get_export_fields(cls.env, [
+                ('name', 'Name'),
+                ('list_price', 'Price'),
+                ('default_code', 'Reference'),
+                ('weight', 'Weight'),
+                ('catalog_description', 'Catalog Description'),
+                ('image_url', 'Image URL'),
+                ('barcode', 'Barcode'),
+                ('description_sale', 'Sales Description'),
+            ])
+        }
+
+    def _enable_export_fields(self, *tech_names):
+        """Helper: enable only the given export fields in the config"""
+        self.config.export_field_ids = self.env['catalog.export.field'].concat(*(
+            self.export_fields[tech_name] for tech_name in tech_names
+        ))
+
     def test_catalog_fields_exist(self):
         """Test that catalog-specific fields exist"""
-        self.assertTrue(hasattr(self.product, 'is_published'))
-        self.assertTrue(hasattr(self.product, 'catalog_featured'))
-        self.assertTrue(hasattr(self.product, 'catalog_description'))
-        self.assertTrue(hasattr(self.product, 'catalog_public'))
+        product_fields = self.product._fields
+        for field_name in ('is_published', 'catalog_featured', 'catalog_description', 'catalog_public'):
+            self.assertIn(field_name, product_fields)
 
     def test_default_is_published(self):
         """Test that is_published defaults to False (website module default)"""
@@ -71,16 +95,15 @@ class TestProductTemplate(TransactionCase):
 
     def test_action_publish_multiple_products(self):
         """Test publish action works on multiple products"""
-        product2 = self.env['product.template'].create({
+        products = self.env['product.template'].create([{
             'name': 'Product 2',
             'is_published': False,
-        })
-        product3 = self.env['product.template'].create({
+        }, {
             'name': 'Product 3',
             'is_published': False,
-        })
+        }])
+        product2, product3 = products
 
-        products = product2 | product3
         products.action_publish_catalog()
 
         self.assertTrue(product2.is_published)
@@ -88,24 +111,7 @@ class TestProductTemplate(TransactionCase):
 
     def test_get_catalog_data_basic(self):
         """Test get_catalog_data returns correct data"""
-        # Create export fields to enable
-        ExportField = self.env['catalog.export.field']
-        fields_to_enable = []
-        for name, tech_name in [
-            ('Name', 'name'),
-            ('Price', 'list_price'),
-            ('Reference', 'default_code'),
-        ]:
-            field = ExportField.search([('technical_name', '=', tech_name)], limit=1)
-            if not field:
-                field = ExportField.create({
-                    'name': name,
-                    'technical_name': tech_name,
-                    'is_default': True,
-                })
-            fields_to_enable.append(field.id)
-
-        self.config.export_field_ids = [(6, 0, fields_to_enable)]
+        self._enable_export_fields('name', 'list_price', 'default_code')
 
         data = self.product.get_catalog_data()
 
@@ -131,33 +137,33 @@ class TestProductTemplate(TransactionCase):
         })
 
         # Enable list_price field
-        ExportField = self.env['catalog.export.field']
-        price_field = ExportField.search([('technical_name', '=', 'list_price')], limit=1)
-        if not price_field:
-            price_field = ExportField.create({
-                'name': 'Price',
-                'technical_name': 'list_price',
-                'is_default': True,
-            })
-        self.config.export_field_ids = [(6, 0, [price_field.id])]
+        self._enable_export_fields('list_price')
 
         data = self.product.get_catalog_data(pricelist=pricelist)
 
         self.assertEqual(data.get('list_price'), 100.0)
 
-    def test_get_catalog_data_custom_export_fields(self):
-        """Test get_catalog_data respects custom export fields"""
-        ExportField = self.env['catalog.export.field']
+        # Same price through prices computed beforehand in one batch
+        prices = pricelist._get_products_price(self.product, 1.0)
+        data = self.product.get_catalog_data(pricelist=pricelist, price_cache=prices)
+
+        self.assertEqual(data.get('list_price'), 100.0)
 
-        # Create and enable only specific fields
-        name_field = ExportField.search([('technical_name', '=', 'name')], limit=1)
-        if not name_field:
-            name_field = ExportField.create({
-                'name': 'Name',
-                'technical_name': 'name',
-            })
+    def test_get_catalog_data_with_price_cache(self):
+        """Test get_catalog_data takes the price from price_cache when given"""
+        self._enable_export_fields('list_price')
 
-        self.config.export_field_ids = [(6, 0, [name_field.id])]
+        data = self.product.get_catalog_data(price_cache={self.product.id: 42.0})
+        self.assertEqual(data.get('list_price'), 42.0)
+
+        # Products missing from the cache fall back to their list price
+        data = self.product.get_catalog_data(price_cache={})
+        self.assertEqual(data.get('list_price'), 150.0)
+
+    def test_get_catalog_data_custom_export_fields(self):
+        """Test get_catalog_data respects custom export fields"""
+        # Enable only specific fields
+        self._enable_export_fields('name')
 
         data = self.product.get_catalog_data()
 
@@ -170,16 +176,7 @@ class TestProductTemplate(TransactionCase):
 
     def test_get_catalog_data_with_explicit_fields(self):
         """Test get_catalog_data with explicit export_fields parameter"""
-        ExportField = self.env['catalog.export.field']
-
-        weight_field = ExportField.search([('technical_name', '=', 'weight')], limit=1)
-        if not weight_field:
-            weight_field = ExportField.create({
-                'name': 'Weight',
-                'technical_name': 'weight',
-            })
-
-        data = self.product.get_catalog_data(export_fields=weight_field)
+        data = self.product.get_catalog_data(export_fields=self.export_fields['weight'])
 
         self.assertIn('id', data)
         self.assertIn('weight', data)
@@ -187,14 +184,7 @@ class TestProductTemplate(TransactionCase):
 
     def test_catalog_description_fallback(self):
         """Test catalog_description falls back to description_sale"""
-        ExportField = self.env['catalog.export.field']
-        desc_field = ExportField.search([('technical_name', '=', 'catalog_description')], limit=1)
-        if not desc_field:
-            desc_field = ExportField.create({
-                'name': 'Catalog Description',
-                'technical_name': 'catalog_description',
-            })
-        self.config.export_field_ids = [(6, 0, [desc_field.id])]
+        self._enable_export_fields('catalog_description')
 
         # Product has description_sale but no catalog_description
         self.assertFalse(self.product.catalog_description)
@@ -206,14 +196,7 @@ class TestProductTemplate(TransactionCase):
 
     def test_image_url_format(self):
         """Test image_url is correctly formatted"""
-        ExportField = self.env['catalog.export.field']
-        image_field = ExportField.search([('technical_name', '=', 'image_url')], limit=1)
-        if not image_field:
-            image_field = ExportField.create({
-                'name': 'Image URL',
-                'technical_name': 'image_url',
-            })
-        self.config.export_field_ids = [(6, 0, [image_field.id])]
+        self._enable_export_fields('image_url')
 
         data = self.product.get_catalog_data()
 
@@ -236,21 +219,22 @@ class TestProductTemplate(TransactionCase):
         self.assertFalse(self.product.last_export_date)
 
         # Create logs
-        self.env['catalog.access.log'].create({
+        self.env['catalog.access.log'].create([{
             'action': 'export_csv',
             'product_ids': [(6, 0, [self.product.id])],
-        })
-        self.env['catalog.access.log'].create({
+        }, {
             'action': 'view_product',
             'product_ids': [(6, 0, [self.product.id])],
-        })
+        }])
 
-        # Refresh
-        self.product.invalidate_recordset()
+        # Refresh the statistics only
+        stats_fields = ['export_count', 'view_count', 'last_export_date']
+        self.product.invalidate_recordset(stats_fields)
 
-        self.assertEqual(self.product.export_count, 1)
-        self.assertEqual(self.product.view_count, 1)
-        self.assertTrue(self.product.last_export_date)
+        stats = self.product.read(stats_fields)[0]
+        self.assertEqual(stats['export_count'], 1)
+        self.assertEqual(stats['view_count'], 1)
+        self.assertTrue(stats['last_export_date'])
 
     def test_empty_values_handled(self):
         """Test that empty/None values are handled gracefully"""
@@ -259,18 +243,7 @@ class TestProductTemplate(TransactionCase):
             # No default_code, barcode, description, etc.
         })
 
-        ExportField = self.env['catalog.export.field']
-        fields_to_enable = []
-        for tech_name in ['name', 'default_code', 'barcode', 'description_sale']:
-            field = ExportField.search([('technical_name', '=', tech_name)], limit=1)
-            if not field:
-                field = ExportField.create({
-                    'name': tech_name,
-                    'technical_name': tech_name,
-                })
-            fields_to_enable.append(field.id)
-
-        self.config.export_field_ids = [(6, 0, fields_to_enable)]
+        self._enable_export_fields('name', 'default_code', 'barcode', 'description_sale')
 
         data = product.get_catalog_data()
 
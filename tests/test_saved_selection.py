@@ -1,46 +1,42 @@
 # -*- coding: utf-8 -*-
 
-from odoo.tests import TransactionCase, tagged
+from odoo.tests import tagged
+
+from .common import CatalogCommon
 
 
 @tagged('post_install', '-at_install', 'catalog')
-class TestCatalogSavedSelection(TransactionCase):
+class TestCatalogSavedSelection(CatalogCommon):
     """Tests for catalog.saved.selection model"""
 
     @classmethod
     def setUpClass(cls):
         super().setUpClass()
-        cls.partner = cls.env['res.partner'].create({
-            'name': 'Selection Test Partner',
-            'email': 'selection@example.com',
+        # Partner of the client unlinked by the cascade test, a partner can
+        # only have one catalog client
+        cls.deletable_partner = cls.env['res.partner'].create({
+            'name': 'Deletable Partner',
+            'email': 'deletable@example.com',
         })
         cls.client = cls.env['catalog.client'].create({
             'name': 'Selection Test Client',
             'partner_id': cls.partner.id,
         })
-        cls.product1 = cls.env['product.template'].create({
-            'name': 'Selection Product 1',
-            'is_published': True,
-            'list_price': 100.0,
-        })
-        cls.product2 = cls.env['product.template'].create({
-            'name': 'Selection Product 2',
-            'is_published': True,
-            'list_price': 200.0,
-        })
         cls.product3 = cls.env['product.template'].create({
-            'name': 'Selection Product 3',
+            'name': 'Test Product 3',
             'is_published': True,
+            'categ_id': cls.category.id,
             'list_price': 300.0,
         })
+        cls.selection = cls.env['catalog.saved.selection'].create({
+            'name': 'My Selection',
+            'catalog_client_id': cls.client.id,
+            'product_ids': [(6, 0, [cls.product1.id, cls.product2.id])],
+        })
 
     def test_saved_selection_creation(self):
         """Test basic saved selection creation"""
-        selection = self.env['catalog.saved.selection'].create({
-            'name': 'My Selection',
-            'catalog_client_id': self.client.id,
-            'product_ids': [(6, 0, [self.product1.id, self.product2.id])],
-        })
+        selection = self.selection
 
         self.assertTrue(selection)
         self.assertEqual(selection.name, 'My Selection')
@@ -77,7 +73,7 @@ class TestCatalogSavedSelection(TransactionCase):
         self.assertEqual(selection.product_count, 1)
 
         # Add more products
-        selection.product_ids = [(6, 0, [self.product1.id, self.product2.id])]
+        selection.product_ids = [(4, self.product2.id)]
         self.assertEqual(selection.product_count, 2)
 
         # Remove a product
@@ -86,11 +82,7 @@ class TestCatalogSavedSelection(TransactionCase):
 
     def test_action_load_selection(self):
         """Test loading a saved selection into client's cart"""
-        selection = self.env['catalog.saved.selection'].create({
-            'name': 'Loadable Selection',
-            'catalog_client_id': self.client.id,
-            'product_ids': [(6, 0, [self.product1.id, self.product2.id])],
-        })
+        selection = self.selection
 
         # Initially client has no selected products
         self.assertEqual(len(self.client.selected_product_ids), 0)
@@ -99,9 +91,10 @@ class TestCatalogSavedSelection(TransactionCase):
         result = selection.action_load_selection()
 
         # Client should now have the products
-        self.assertEqual(len(self.client.selected_product_ids), 2)
-        self.assertIn(self.product1, self.client.selected_product_ids)
-        self.assertIn(self.product2, self.client.selected_product_ids)
+        selected_ids = self.client.selected_product_ids.ids
+        self.assertEqual(len(selected_ids), 2)
+        self.assertIn(self.product1.id, selected_ids)
+        self.assertIn(self.product2.id, selected_ids)
 
         # Should return a notification action
         self.assertEqual(result['type'], 'ir.actions.client')
@@ -114,27 +107,19 @@ class TestCatalogSavedSelection(TransactionCase):
         self.client.selected_product_ids = [(6, 0, [self.product3.id])]
         self.assertEqual(len(self.client.selected_product_ids), 1)
 
-        # Create and load a different selection
-        selection = self.env['catalog.saved.selection'].create({
-            'name': 'Replace Selection',
-            'catalog_client_id': self.client.id,
-            'product_ids': [(6, 0, [self.product1.id, self.product2.id])],
-        })
-        selection.action_load_selection()
+        # Load a different selection
+        self.selection.action_load_selection()
 
         # Client's cart should be replaced
-        self.assertEqual(len(self.client.selected_product_ids), 2)
-        self.assertNotIn(self.product3, self.client.selected_product_ids)
+        selected_ids = set(self.client.selected_product_ids.ids)
+        self.assertEqual(selected_ids, {self.product1.id, self.product2.id})
+        self.assertNotIn(self.product3.id, selected_ids)
 
     def test_cascade_delete_on_client(self):
         """Test selections are deleted when client is deleted"""
-        partner = self.env['res.partner'].create({
-            'name': 'Deletable Partner',
-            'email': 'deletable@example.com',
-        })
         client = self.env['catalog.client'].create({
             'name': 'Deletable Client',
-            'partner_id': partner.id,
+            'partner_id': self.deletable_partner.id,
         })
         selection = self.env['catalog.saved.selection'].create({
             'name': 'Cascade Test',
@@ -159,24 +144,22 @@ class TestCatalogSavedSelection(TransactionCase):
             'catalog_client_id': self.client.id,
         })
 
-        selections = self.env['catalog.saved.selection'].search([
-            ('catalog_client_id', '=', self.client.id),
-            ('id', 'in', [sel1.id, sel2.id]),
-        ])
+        # Without key, sorted() applies the model's _order
+        selections = (sel1 | sel2).sorted()
 
         # Most recent first
         self.assertEqual(selections[0].id, sel2.id)
 
     def test_multiple_selections_per_client(self):
         """Test client can have multiple saved selections"""
-        for i in range(5):
-            self.env['catalog.saved.selection'].create({
-                'name': f'Selection {i}',
-                'catalog_client_id': self.client.id,
-                'product_ids': [(6, 0, [self.product1.id])],
-            })
+        self.env['catalog.saved.selection'].create([{
+            'name': f'Selection {i}',
+            'catalog_client_id': self.client.id,
+            'product_ids': [(6, 0, [self.product1.id])],
+        } for i in range(5)])
 
         selections = self.env['catalog.saved.selection'].search([
             ('catalog_client_id', '=', self.client.id),
         ])
-        self.assertEqual(len(selections), 5)
+        # The 5 new selections plus the class-level one
+        self.assertEqual(len(selections), 6)